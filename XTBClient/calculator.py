@@ -0,0 +1,108 @@
+from typing import Iterable, Optional, Sequence
+
+from XTBClient.errors import UnknownSymbolError, UnsupportedCalculation
+from XTBClient.models.models import Symbol, MarginMode, ProfitMode, TradeOperation
+
+# operations that profit when the price goes up
+_LONG_OPERATIONS = {TradeOperation.Buy, TradeOperation.Buy_Limit, TradeOperation.Buy_Stop}
+
+
+class TradeCalculator:
+    """
+    Computes margin and profit locally from Symbol metadata, the same way the calcMargin / calcProfit commands do,
+    for whole lists of positions at once. Values are returned in the account currency, conversions use the cached quotes.
+
+    Margin is supported for the Forex, CFD_Leveraged and CFD margin modes, other modes raise UnsupportedCalculation.
+    Hedging is out of scope: every position is margined on its own, offsetting positions aren't netted using margin_hedged.
+    """
+
+    def __init__(self, currency: str, symbols: Iterable[Symbol] = ()):
+        self.currency = currency  # account currency, see CurrentUserData.currency
+        self.symbols: dict[str, Symbol] = {}
+        self._rates: dict[str, float] = {}  # conversion rate from a currency to the account currency
+        self.update_quotes(symbols)
+
+    def update_quotes(self, symbols: Iterable[Symbol]) -> None:
+        """Adds or refreshes the cached symbols (e.g. with the result of get_all_symbols or get_symbol)"""
+        for symbol in symbols:
+            self.symbols[symbol.symbol] = symbol
+        self._rates.clear()  # prices changed, conversion rates need to be looked up again
+
+    def conversion_rate(self, currency: str) -> float:
+        """Returns the value of 1 unit of `currency` in the account currency"""
+        rate = self._rates.get(currency)
+        if rate is not None:
+            return rate
+
+        if currency == self.currency:
+            rate = 1.0
+        elif currency + self.currency in self.symbols:
+            rate = self.symbols[currency + self.currency].bid
+        elif self.currency + currency in self.symbols:
+            rate = 1.0 / self.symbols[self.currency + currency].ask
+        else:
+            raise UnknownSymbolError(f"No quote available to convert {currency} to {self.currency}")
+
+        self._rates[currency] = rate
+        return rate
+
+    def _symbol(self, name: str) -> Symbol:
+        try:
+            return self.symbols[name]
+        except KeyError:
+            raise UnknownSymbolError(f"Symbol {name} is not cached") from None
+
+    def _margin_factor(self, name: str) -> tuple[float, bool]:
+        # margin per lot (or per lot and unit of price), in account currency, and whether the price is needed
+        symbol = self._symbol(name)
+        factor = symbol.contract_size * symbol.leverage / 100
+        if symbol.margin_mode == MarginMode.Forex:
+            # forex margin is expressed in the base currency and doesn't depend on the price
+            return factor * self.conversion_rate(symbol.currency), False
+        if symbol.margin_mode in (MarginMode.CFD_Leveraged, MarginMode.CFD):
+            # nominal value of the position times the margin percentage, in the profit currency
+            return factor * self.conversion_rate(symbol.currency_profit), True
+        raise UnsupportedCalculation(f"Margin mode {symbol.margin_mode.name} of {name} is not supported, use calc_margin on the client")
+
+    def _profit_factor(self, name: str) -> float:
+        # profit per lot and unit of price, in account currency
+        symbol = self._symbol(name)
+        if symbol.profit_mode == ProfitMode.CFD and symbol.tick_size and symbol.tick_value:
+            factor = symbol.tick_value / symbol.tick_size
+        else:
+            factor = symbol.contract_size
+        return factor * self.conversion_rate(symbol.currency_profit)
+
+    def calc_margins(self, symbols: Sequence[str], volumes: Sequence[float], prices: Optional[Sequence[Optional[float]]] = None) -> list[float]:
+        """Margin needed for each position, if no price is given the current ask price is used"""
+        factors = {}
+        margins = []
+        for i, (name, volume) in enumerate(zip(symbols, volumes)):
+            factor = factors.get(name)
+            if factor is None:
+                factor = factors[name] = self._margin_factor(name)
+            value, needs_price = factor
+            if needs_price:
+                price = prices[i] if prices is not None else None
+                value *= price if price is not None else self.symbols[name].ask
+            margins.append(value * volume)
+        return margins
+
+    def calc_profits(self, symbols: Sequence[str], cmds: Sequence[TradeOperation], volumes: Sequence[float], open_prices: Sequence[float],
+                     close_prices: Sequence[float]) -> list[float]:
+        """Profit of each position if closed at the given close price"""
+        factors = {}
+        profits = []
+        for name, cmd, volume, open_price, close_price in zip(symbols, cmds, volumes, open_prices, close_prices):
+            factor = factors.get(name)
+            if factor is None:
+                factor = factors[name] = self._profit_factor(name)
+            difference = close_price - open_price if cmd in _LONG_OPERATIONS else open_price - close_price
+            profits.append(difference * factor * volume)
+        return profits
+
+    def calc_margin(self, symbol: str, volume: float, price: Optional[float] = None) -> float:
+        return self.calc_margins([symbol], [volume], [price])[0]
+
+    def calc_profit(self, symbol: str, cmd: TradeOperation, volume: float, open_price: float, close_price: float) -> float:
+        return self.calc_profits([symbol], [cmd], [volume], [open_price], [close_price])[0]
@@ -0,0 +1,13 @@
+# clients are only imported when first accessed, so using one of them doesn't load the websocket library of the other one
+_CLIENTS = {
+    "XTBAsyncClient": "XTBClient.client.axtb",
+    "XTBSyncClient": "XTBClient.client.xtb",
+    "XTBLanesAsyncClient": "XTBClient.client.lanes",
+}
+
+
+def __getattr__(name):
+    if name in _CLIENTS:
+        import importlib
+        return getattr(importlib.import_module(_CLIENTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
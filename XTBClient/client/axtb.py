@@ -3,14 +3,13 @@ import json
 import typing
 from typing import Type, Optional, Union
 
-import websockets
 from dataclasses_json import dataclass_json
 
 from XTBClient.errors import NotLoggedInError, InvalidCall
 from XTBClient.models.models import ConnectionMode, ApiCommand, XTBCommand, Symbol, Calendar, CurrentUserData, Trade, RateHistory, \
-    RateInfo, Transaction, TransactionStatus
+    RateInfo, Transaction, TransactionStatus, TradeOperation, News
 from XTBClient.models.requests import SymbolRequest, TradesRequest, TradesHistoryRequest, ChartLastInfoRecord, ChartLastRequest, ChartRangeRecord, \
-    TransactionRequest, TransactionStatusRequest
+    TransactionRequest, TransactionStatusRequest, MarginTradeRequest, ProfitCalculationRequest, NewsRequest
 from XTBClient.xtb_base import XTBBaseClient
 
 
@@ -63,6 +62,8 @@ class XTBAsyncClient(XTBBaseClient):
         self.stream_session_id = None
 
     async def __aenter__(self):
+        import websockets  # only load the websocket library when it's actually used
+
         self.xtb_session = await websockets.connect(f"{self.url}/{self.mode.value}", max_size=None)  # async web socket
 
         self.logger.debug("Entering async_client context manager")
@@ -85,6 +86,16 @@ class XTBAsyncClient(XTBBaseClient):
     async def get_calendar(self) -> list[Calendar]:
         return await self._send_message_logged_in(XTBCommand.GET_CALENDAR, None, list[Calendar])
 
+    async def get_news(self, start: datetime.datetime, end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[News]:
+        return await self._send_message_logged_in(XTBCommand.GET_NEWS, NewsRequest(start=start, end=end), list[News])
+
+    async def get_calendar_raw(self) -> list[dict]:
+        # calendar entries as sent by the server, not decoded, see XTBClient.watcher
+        return await self._send_message_logged_in(XTBCommand.GET_CALENDAR, None, list[dict])
+
+    async def get_news_raw(self, start: datetime.datetime, end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[dict]:
+        return await self._send_message_logged_in(XTBCommand.GET_NEWS, NewsRequest(start=start, end=end), list[dict])
+
     async def get_current_user_data(self) -> CurrentUserData:
         return await self._send_message_logged_in(XTBCommand.GET_CURRENT_USER_DATA, None, CurrentUserData)
 
@@ -107,8 +118,21 @@ class XTBAsyncClient(XTBBaseClient):
         data = await self._send_message_logged_in(XTBCommand.GET_CHART_RANGE_REQUEST, ChartLastRequest(chart_range), RateHistory)
         return self._process_rates(data.rate_infos, data.digits)
 
+    async def get_chart_range_request_raw(self, chart_range: ChartRangeRecord) -> dict:
+        # digits and rateInfos as sent by the server, prices aren't converted, see XTBClient.export
+        return await self._send_message_logged_in(XTBCommand.GET_CHART_RANGE_REQUEST, ChartLastRequest(chart_range), dict)
+
+    async def get_trades_history_raw(self, start: datetime.datetime = datetime.datetime.fromtimestamp(0), end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[dict]:
+        return await self._send_message_logged_in(XTBCommand.GET_TRADES_HISTORY, TradesHistoryRequest(start=start, end=end), list[dict])
+
     async def trade_transaction(self, transaction: Transaction) -> int:
         return await self._send_message_logged_in(XTBCommand.TRADE_TRANSACTION, TransactionRequest(transaction), int)
 
     async def transaction_status(self, transaction_id: int) -> TransactionStatus:
-        return await self._send_message_logged_in(XTBCommand.TRANSACTION_STATUS, TransactionStatusRequest(transaction_id), TransactionStatus)
\ No newline at end of file
+        return await self._send_message_logged_in(XTBCommand.TRANSACTION_STATUS, TransactionStatusRequest(transaction_id), TransactionStatus)
+
+    async def calc_margin(self, symbol: str, volume: float) -> float:
+        return await self._send_message_logged_in(XTBCommand.GET_MARGIN_TRADE, MarginTradeRequest(symbol, volume), float)
+
+    async def calc_profit(self, symbol: str, cmd: TradeOperation, volume: float, open_price: float, close_price: float) -> float:
+        return await self._send_message_logged_in(XTBCommand.GET_PROFIT_CALCULATION, ProfitCalculationRequest(close_price, cmd, open_price, symbol, volume), float)
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Type, Optional
+
+from dataclasses_json import dataclass_json
+
+from XTBClient.client.axtb import XTBAsyncClient
+from XTBClient.errors import NotLoggedInError
+from XTBClient.models.models import ConnectionMode, XTBCommand
+
+TRADING_LANE = "trading"
+BULK_LANE = "bulk"
+
+# commands that must not wait behind big downloads, everything else goes to the default lane
+DEFAULT_ROUTES = {
+    XTBCommand.TRADE_TRANSACTION: TRADING_LANE,
+    XTBCommand.TRANSACTION_STATUS: TRADING_LANE,
+    XTBCommand.GET_TRADES: TRADING_LANE,
+}
+
+
+@dataclass
+class LaneStats:
+    count: int = 0
+    total: float = 0.0  # seconds, including the time spent waiting for the lane to be free
+    max: float = 0.0
+    last: float = 0.0
+    per_command: dict[XTBCommand, int] = field(default_factory=dict)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, command: XTBCommand, latency: float) -> None:
+        self.count += 1
+        self.total += latency
+        self.last = latency
+        if latency > self.max:
+            self.max = latency
+        self.per_command[command] = self.per_command.get(command, 0) + 1
+
+
+class XTBLanesAsyncClient(XTBAsyncClient):
+    """
+    Async client using one session (web socket) per lane, so a trade transaction doesn't have to wait for a big
+    get_all_symbols or chart response to finish downloading on the same socket.
+    Commands are routed to lanes using `routes`, the ones not in there go to `default_lane`.
+    """
+
+    def __init__(self, user: str, password: str, mode: ConnectionMode, automatic_logout=True, url: str = "wss://ws.xtb.com/", custom_tag: str = "python-xtb-api",
+                 routes: Optional[dict[XTBCommand, str]] = None, default_lane: str = BULK_LANE):
+        super().__init__(user, password, mode, automatic_logout, url, custom_tag)
+        self.routes = {**DEFAULT_ROUTES, **(routes or {})}
+        self.default_lane = default_lane
+
+        names = sorted(set(self.routes.values()) | {default_lane})
+        self.lanes: dict[str, XTBAsyncClient] = {name: XTBAsyncClient(user, password, mode, automatic_logout, url, custom_tag) for name in names}
+        self.stats: dict[str, LaneStats] = {name: LaneStats() for name in names}
+        self._locks: dict[str, asyncio.Lock] = {}  # one request at a time on each socket, created once we're inside an event loop
+
+    def lane_for(self, command: XTBCommand) -> str:
+        return self.routes.get(command, self.default_lane)
+
+    async def _send_message_logged_in(self, command: XTBCommand, payload: Optional[dataclass_json], result_type: Type[dataclass_json]) -> Type[dataclass_json]:
+        if not self.logged_in:
+            raise NotLoggedInError("Must log in first")
+
+        lane = self.lane_for(command)
+        lock = self._locks.get(lane)
+        if lock is None:
+            lock = self._locks[lane] = asyncio.Lock()
+
+        start = time.perf_counter()
+        try:
+            async with lock:
+                return await self.lanes[lane]._send_message_logged_in(command, payload, result_type)
+        finally:
+            self.stats[lane].add(command, time.perf_counter() - start)
+
+    async def login(self) -> None:
+        await asyncio.gather(*(client.login() for client in self.lanes.values() if not client.logged_in))
+        self.stream_session_id = self.lanes[self.default_lane].stream_session_id
+        self.logged_in = True
+
+    async def logout(self) -> None:
+        await asyncio.gather(*(client.logout() for client in self.lanes.values() if client.logged_in))
+        self.logged_in = False
+        self.stream_session_id = None
+
+    async def __aenter__(self):
+        self.logger.debug("Entering lanes async_client context manager")
+        clients = list(self.lanes.values())
+        results = await asyncio.gather(*(client.__aenter__() for client in clients), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # close whatever did connect (or connected but failed to log in), don't leave sessions open behind us
+            error = errors[0]
+            opened = [client for client in clients if getattr(client, "xtb_session", None)]
+            await asyncio.gather(*(client.__aexit__(type(error), error, error.__traceback__) for client in opened), return_exceptions=True)
+            raise error
+
+        self.stream_session_id = self.lanes[self.default_lane].stream_session_id
+        self.logged_in = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.logger.debug("Exiting lanes async_client context manager")
+        await asyncio.gather(*(client.__aexit__(exc_type, exc, tb) for client in self.lanes.values()))
+        self.logged_in = any(client.logged_in for client in self.lanes.values())
+        if not self.logged_in:
+            self.stream_session_id = None
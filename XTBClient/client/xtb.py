@@ -4,14 +4,13 @@ import typing
 import urllib.parse
 from typing import Type, Optional, Union
 
-import websocket
 from dataclasses_json import dataclass_json
 
 from XTBClient.errors import NotLoggedInError, InvalidCall
 from XTBClient.models.models import ConnectionMode, ApiCommand, XTBCommand, Symbol, Calendar, CurrentUserData, Trade, RateHistory, \
-    RateInfo, Transaction, TransactionStatus
+    RateInfo, Transaction, TransactionStatus, TradeOperation, News
 from XTBClient.models.requests import SymbolRequest, TradesRequest, TradesHistoryRequest, ChartLastInfoRecord, ChartLastRequest, ChartRangeRecord, \
-    TransactionRequest, TransactionStatusRequest
+    TransactionRequest, TransactionStatusRequest, MarginTradeRequest, ProfitCalculationRequest, NewsRequest
 from XTBClient.xtb_base import XTBBaseClient
 
 
@@ -65,6 +64,8 @@ class XTBSyncClient(XTBBaseClient):
         self.stream_session_id = None
 
     def __enter__(self):
+        import websocket  # only load the websocket library when it's actually used
+
         # if we're told not to use a proxy, actually stop using the proxy ffs
         http_no_proxy = None
         if not self.proxy:
@@ -95,6 +96,16 @@ class XTBSyncClient(XTBBaseClient):
     def get_calendar(self) -> list[Calendar]:
         return self._send_message_logged_in(XTBCommand.GET_CALENDAR, None, list[Calendar])
 
+    def get_news(self, start: datetime.datetime, end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[News]:
+        return self._send_message_logged_in(XTBCommand.GET_NEWS, NewsRequest(start=start, end=end), list[News])
+
+    def get_calendar_raw(self) -> list[dict]:
+        # calendar entries as sent by the server, not decoded, see XTBClient.watcher
+        return self._send_message_logged_in(XTBCommand.GET_CALENDAR, None, list[dict])
+
+    def get_news_raw(self, start: datetime.datetime, end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[dict]:
+        return self._send_message_logged_in(XTBCommand.GET_NEWS, NewsRequest(start=start, end=end), list[dict])
+
     def get_current_user_data(self) -> CurrentUserData:
         return self._send_message_logged_in(XTBCommand.GET_CURRENT_USER_DATA, None, CurrentUserData)
 
@@ -117,8 +128,21 @@ class XTBSyncClient(XTBBaseClient):
         data = self._send_message_logged_in(XTBCommand.GET_CHART_RANGE_REQUEST, ChartLastRequest(chart_range), RateHistory)
         return self._process_rates(data.rate_infos, data.digits)
 
+    def get_chart_range_request_raw(self, chart_range: ChartRangeRecord) -> dict:
+        # digits and rateInfos as sent by the server, prices aren't converted, see XTBClient.export
+        return self._send_message_logged_in(XTBCommand.GET_CHART_RANGE_REQUEST, ChartLastRequest(chart_range), dict)
+
+    def get_trades_history_raw(self, start: datetime.datetime = datetime.datetime.fromtimestamp(0), end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[dict]:
+        return self._send_message_logged_in(XTBCommand.GET_TRADES_HISTORY, TradesHistoryRequest(start=start, end=end), list[dict])
+
     def trade_transaction(self, transaction: Transaction) -> int:
         return self._send_message_logged_in(XTBCommand.TRADE_TRANSACTION, TransactionRequest(transaction), int)
 
     def transaction_status(self, transaction_id: int) -> TransactionStatus:
-        return self._send_message_logged_in(XTBCommand.TRANSACTION_STATUS, TransactionStatusRequest(transaction_id), TransactionStatus)
\ No newline at end of file
+        return self._send_message_logged_in(XTBCommand.TRANSACTION_STATUS, TransactionStatusRequest(transaction_id), TransactionStatus)
+
+    def calc_margin(self, symbol: str, volume: float) -> float:
+        return self._send_message_logged_in(XTBCommand.GET_MARGIN_TRADE, MarginTradeRequest(symbol, volume), float)
+
+    def calc_profit(self, symbol: str, cmd: TradeOperation, volume: float, open_price: float, close_price: float) -> float:
+        return self._send_message_logged_in(XTBCommand.GET_PROFIT_CALCULATION, ProfitCalculationRequest(close_price, cmd, open_price, symbol, volume), float)
@@ -4,3 +4,19 @@ class NotLoggedInError(Exception):
 
 class InvalidCall(Exception):
     pass
+
+
+class UnknownSymbolError(Exception):
+    pass
+
+
+class InvalidTransaction(Exception):
+    def __init__(self, symbol: str, field: str, message: str):
+        super().__init__(f"{symbol} {field}: {message}")
+        self.symbol = symbol
+        self.field = field  # the Transaction field that can't be sent
+        self.message = message
+
+
+class UnsupportedCalculation(Exception):
+    pass
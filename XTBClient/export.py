@@ -0,0 +1,124 @@
+"""
+Streaming export of candles and trades to CSV, Arrow (IPC stream) and Parquet.
+
+The exporters work on the raw (JSON decoded) responses, see get_chart_range_request_raw and get_trades_history_raw,
+so no RateInfo / Trade objects are created, and they write `chunk_size` records at a time to keep the memory usage bounded.
+Arrow and Parquet need pyarrow, which is not installed by default (pip install pyarrow).
+"""
+import csv
+import itertools
+from typing import Iterable, Iterator, TextIO
+
+RATE_COLUMNS = ["ctm", "open", "high", "low", "close", "vol"]
+TRADE_COLUMNS = ["position", "order", "order2", "symbol", "cmd", "volume", "open_price", "close_price", "open_time", "close_time", "sl", "tp",
+                 "profit", "commission", "storage", "closed", "comment", "customComment"]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow is needed to export to Arrow / Parquet, install it with `pip install pyarrow`") from None
+    return pyarrow
+
+
+def _chunks(records: Iterable[dict], chunk_size: int) -> Iterator[list[dict]]:
+    iterator = iter(records)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _rate_batches(rate_infos: Iterable[dict], digits: int, chunk_size: int) -> Iterator[dict[str, list]]:
+    # Price values must be divided by 10 to the power of digits in order to obtain exact prices (same as XTBBaseClient._process_rates)
+    multiplier = 10 ** digits
+    for chunk in _chunks(rate_infos, chunk_size):
+        opens = [rate["open"] for rate in chunk]
+        yield {
+            "ctm": [rate["ctm"] for rate in chunk],
+            "open": [price / multiplier for price in opens],
+            "high": [(price + rate["high"]) / multiplier for price, rate in zip(opens, chunk)],
+            "low": [(price + rate["low"]) / multiplier for price, rate in zip(opens, chunk)],
+            "close": [(price + rate["close"]) / multiplier for price, rate in zip(opens, chunk)],
+            "vol": [rate["vol"] for rate in chunk],
+        }
+
+
+def _trade_batches(trades: Iterable[dict], chunk_size: int) -> Iterator[dict[str, list]]:
+    for chunk in _chunks(trades, chunk_size):
+        yield {column: [trade.get(column) for trade in chunk] for column in TRADE_COLUMNS}
+
+
+def _arrow_schema(columns: list[str]):
+    pa = _pyarrow()
+    types = {
+        "ctm": pa.timestamp("ms", tz="UTC"), "open_time": pa.timestamp("ms", tz="UTC"), "close_time": pa.timestamp("ms", tz="UTC"),
+        "position": pa.int64(), "order": pa.int64(), "order2": pa.int64(), "cmd": pa.int8(), "closed": pa.bool_(),
+        "symbol": pa.string(), "comment": pa.string(), "customComment": pa.string(),
+    }
+    return pa.schema([(column, types.get(column, pa.float64())) for column in columns])
+
+
+def _write_csv(batches: Iterator[dict[str, list]], columns: list[str], destination: TextIO) -> int:
+    # timestamps are written as they come, milliseconds since epoch (UTC)
+    writer = csv.writer(destination)
+    writer.writerow(columns)
+    count = 0
+    for batch in batches:
+        rows = list(zip(*(batch[column] for column in columns)))
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+
+def _write_arrow(batches: Iterator[dict[str, list]], columns: list[str], destination) -> int:
+    pa = _pyarrow()
+    schema = _arrow_schema(columns)
+    count = 0
+    with pa.ipc.new_stream(destination, schema) as writer:
+        for batch in batches:
+            writer.write_batch(pa.record_batch([batch[column] for column in columns], schema=schema))
+            count += len(batch[columns[0]])
+    return count
+
+
+def _write_parquet(batches: Iterator[dict[str, list]], columns: list[str], destination) -> int:
+    pa = _pyarrow()
+    schema = _arrow_schema(columns)
+    count = 0
+    with pa.parquet.ParquetWriter(destination, schema) as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([pa.record_batch([batch[column] for column in columns], schema=schema)]))
+            count += len(batch[columns[0]])
+    return count
+
+
+def rates_to_csv(rate_infos: Iterable[dict], digits: int, destination: TextIO, chunk_size: int = 10000) -> int:
+    """Writes the raw rateInfos of a chart response as CSV, returns the number of candles written"""
+    return _write_csv(_rate_batches(rate_infos, digits, chunk_size), RATE_COLUMNS, destination)
+
+
+def rates_to_arrow(rate_infos: Iterable[dict], digits: int, destination, chunk_size: int = 10000) -> int:
+    """Writes the raw rateInfos of a chart response as an Arrow IPC stream (file path or writable stream)"""
+    return _write_arrow(_rate_batches(rate_infos, digits, chunk_size), RATE_COLUMNS, destination)
+
+
+def rates_to_parquet(rate_infos: Iterable[dict], digits: int, destination, chunk_size: int = 10000) -> int:
+    """Writes the raw rateInfos of a chart response as Parquet, one row group per chunk"""
+    return _write_parquet(_rate_batches(rate_infos, digits, chunk_size), RATE_COLUMNS, destination)
+
+
+def trades_to_csv(trades: Iterable[dict], destination: TextIO, chunk_size: int = 10000) -> int:
+    """Writes raw trades (e.g. from get_trades_history_raw) as CSV, returns the number of trades written"""
+    return _write_csv(_trade_batches(trades, chunk_size), TRADE_COLUMNS, destination)
+
+
+def trades_to_arrow(trades: Iterable[dict], destination, chunk_size: int = 10000) -> int:
+    """Writes raw trades as an Arrow IPC stream (file path or writable stream)"""
+    return _write_arrow(_trade_batches(trades, chunk_size), TRADE_COLUMNS, destination)
+
+
+def trades_to_parquet(trades: Iterable[dict], destination, chunk_size: int = 10000) -> int:
+    """Writes raw trades as Parquet, one row group per chunk"""
+    return _write_parquet(_trade_batches(trades, chunk_size), TRADE_COLUMNS, destination)
@@ -27,11 +27,10 @@ dataclasses_json.cfg.global_config.decoders[Optional[datetime.datetime]] = guard
 
 
 class XTBDateTime(fields.DateTime):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
-        self.DESERIALIZATION_FUNCS["timestamp_ms"] = guarded_datetime_2_milliseconds_decoder
-        self.SERIALIZATION_FUNCS["timestamp_ms"] = guarded_datetime_2_milliseconds_encoder
+    # register marshmallow datetime serialization and deserialization
+    # add a new format called timestamp_ms, only for our own fields
+    DESERIALIZATION_FUNCS = {**fields.DateTime.DESERIALIZATION_FUNCS, "timestamp_ms": guarded_datetime_2_milliseconds_decoder}
+    SERIALIZATION_FUNCS = {**fields.DateTime.SERIALIZATION_FUNCS, "timestamp_ms": guarded_datetime_2_milliseconds_encoder}
 
     def _deserialize(self, value, attr, data, **kwargs):
         if value is None:
@@ -44,8 +43,11 @@ class XTBDateTime(fields.DateTime):
     def _serialize(self, value, **kwargs):
         return guarded_datetime_2_milliseconds_encoder(value)
 
-# register marshmallow datetime serialization and deserialization
-# add a new format called timestamp_ms
+
+# marshmallow copies the fields for every schema, so all the models can share the same field instances
+TIMESTAMP_MS = XTBDateTime(format="timestamp_ms")
+OPTIONAL_TIMESTAMP_MS = XTBDateTime(allow_none=True, format="timestamp_ms")
+
 
 @dataclass
 class XTBDataClass(DataClassJsonMixin):
@@ -68,6 +70,9 @@ class XTBCommand(Enum):
     GET_CHART_RANGE_REQUEST = "getChartRangeRequest"
     TRADE_TRANSACTION = "tradeTransaction"
     TRANSACTION_STATUS = "tradeTransactionStatus"
+    GET_MARGIN_TRADE = "getMarginTrade"
+    GET_PROFIT_CALCULATION = "getProfitCalculation"
+    GET_NEWS = "getNews"
 
 
 class ConnectionMode(Enum):
@@ -186,12 +191,12 @@ class Symbol(XTBDataClass):
     trailing_enabled: bool  # Indicates whether trailing stop (offset) is applicable to the instrument.
     type: int  # Instrument class number
 
-    expiration: Optional[datetime.datetime] = field(default=None, metadata=config(mm_field=XTBDateTime(allow_none=True, format="timestmap_ms")))  # Null if not applicable
-    starting: Optional[datetime.datetime] = field(default=None, metadata=config(mm_field=XTBDateTime(allow_none=True, format="timestmap_ms")))  # Null if not applicable
+    expiration: Optional[datetime.datetime] = field(default=None, metadata=config(mm_field=OPTIONAL_TIMESTAMP_MS))  # Null if not applicable
+    starting: Optional[datetime.datetime] = field(default=None, metadata=config(mm_field=OPTIONAL_TIMESTAMP_MS))  # Null if not applicable
     tick_size: Optional[float] = None  # Smallest possible price change, used for profit/margin calculation, null if not applicable
     tick_value: Optional[float] = None  # Value of smallest possible price change (in base currency), used for profit/margin calculation, null if not applicable
     time: Optional[datetime.datetime] = field(default=None,
-        metadata=config(mm_field=XTBDateTime(allow_none=True, format='timestamp_ms')))  # Ask & bid tick time
+        metadata=config(mm_field=OPTIONAL_TIMESTAMP_MS))  # Ask & bid tick time
 
 
 @dataclass
@@ -205,7 +210,7 @@ class Calendar(XTBDataClass):
     title: str  # Name of the indicator for which values will be released
 
     time: Optional[datetime.datetime] = field(default=None,
-        metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Time, when the information will be released (in this time empty "current" value should be changed with exact released value)
+        metadata=config(mm_field=TIMESTAMP_MS))  # Time, when the information will be released (in this time empty "current" value should be changed with exact released value)
 
 
 @dataclass
@@ -232,7 +237,7 @@ class Trade(XTBDataClass):
     margin_rate: float = field(metadata=config(field_name="margin_rate")) # Margin rate
     offset: int  # Trailing offset
     open_price: float = field(metadata=config(field_name="open_price"))  # Open price in base currency
-    open_time: datetime.datetime = field(metadata=config(field_name="open_time", mm_field=XTBDateTime(format='timestamp_ms')))  # Open time
+    open_time: datetime.datetime = field(metadata=config(field_name="open_time", mm_field=TIMESTAMP_MS))  # Open time
     open_time_string: str = field(metadata=config(field_name="open_timeString"))  # Open time string
     order: int  # Order number for opened transation
     order2: int  # Order number for closed transaction
@@ -240,16 +245,16 @@ class Trade(XTBDataClass):
     profit: float  # Profit in account currency
     sl: float  # Zero if stop loss is not set (in base currency)
     storage: float  # Order swaps in account currency
-    timestamp: datetime.date = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Timestamp
+    timestamp: datetime.date = field(metadata=config(mm_field=TIMESTAMP_MS))  # Timestamp
     tp: float  # Zero if take profit is not set (in base currency)
     volume: float  # Volume in lots
 
     custom_comment: Optional[str] = None  # The value the customer may provide in order to retrieve it later.
     close_time: Optional[datetime.datetime] = field(default=None,
-        metadata=config(mm_field=XTBDateTime(allow_none=True, format='timestamp_ms')))  # Null if order is not closed
+        metadata=config(mm_field=OPTIONAL_TIMESTAMP_MS))  # Null if order is not closed
     close_time_string: Optional[str] = field(default=None, metadata=config(field_name="close_timeString"))  # Null if order is not closed
     expiration: Optional[datetime.datetime] = field(default=None,
-        metadata=config(mm_field=XTBDateTime(allow_none=True, format='timestamp_ms')))  # Null if order is not closed
+        metadata=config(mm_field=OPTIONAL_TIMESTAMP_MS))  # Null if order is not closed
     expiration_string: Optional[str] = None  # Null if order is not closed
     symbol: Optional[str] = None  # symbol name or null for deposit/withdrawal operations
 
@@ -257,7 +262,7 @@ class Trade(XTBDataClass):
 @dataclass
 class RateInfo(XTBDataClass):
     close: decimal.Decimal  # Value of close price (shift from open price)
-    ctm: datetime.datetime = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Candle start time in CET / CEST time zone (see Daylight Saving Time, DST)
+    ctm: datetime.datetime = field(metadata=config(mm_field=TIMESTAMP_MS))  # Candle start time in CET / CEST time zone (see Daylight Saving Time, DST)
     ctm_string: str  # String representation of the 'ctm' field
     high: decimal.Decimal  # Highest value in the given period (shift from open price)
     low: decimal.Decimal  # Lowest value in the given period (shift from open price)
@@ -276,7 +281,7 @@ class News(XTBDataClass):
     body: str  # Body
     bodylen: int  # Body length
     key: str  # News key
-    time: datetime.datetime = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Time
+    time: datetime.datetime = field(metadata=config(mm_field=TIMESTAMP_MS))  # Time
     time_string: str  # Time string
     title: str  # News title
 
@@ -284,7 +289,7 @@ class News(XTBDataClass):
 @dataclass
 class Transaction(XTBDataClass):
     cmd: TradeOperation  # Operation code
-    expiration: datetime.datetime = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Pending order expiration time
+    expiration: datetime.datetime = field(metadata=config(mm_field=TIMESTAMP_MS))  # Pending order expiration time
     offset: int  # Trailing offset
     price: float  # Trade price
     sl: float  # Stop loss
@@ -4,7 +4,7 @@ from typing import Union
 
 from dataclasses_json import config
 
-from XTBClient.models.models import XTBDataClass, Period, XTBDateTime, Transaction
+from XTBClient.models.models import XTBDataClass, Period, TIMESTAMP_MS, Transaction, TradeOperation
 
 
 @dataclass
@@ -29,18 +29,24 @@ class TradesHistoryRequest(XTBDataClass):
     end: datetime.datetime
 
 
+@dataclass
+class NewsRequest(XTBDataClass):
+    start: datetime.datetime  # Time
+    end: datetime.datetime  # Time, 0 means current time for simplification
+
+
 @dataclass
 class ChartLastInfoRecord(XTBDataClass):
     period: Period  # Period code
-    start: datetime.datetime = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Start of chart block (rounded down to the nearest interval and excluding)
+    start: datetime.datetime = field(metadata=config(mm_field=TIMESTAMP_MS))  # Start of chart block (rounded down to the nearest interval and excluding)
     symbol: str  # Symbol
 
 
 @dataclass
 class ChartRangeRecord(XTBDataClass):
     period: Period  # Period code
-    start: datetime.datetime = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # Start of chart block (rounded down to the nearest interval and excluding)
-    end: datetime.datetime = field(metadata=config(mm_field=XTBDateTime(format='timestamp_ms')))  # End of chart block (rounded down to the nearest interval and excluding)
+    start: datetime.datetime = field(metadata=config(mm_field=TIMESTAMP_MS))  # Start of chart block (rounded down to the nearest interval and excluding)
+    end: datetime.datetime = field(metadata=config(mm_field=TIMESTAMP_MS))  # End of chart block (rounded down to the nearest interval and excluding)
     symbol: str  # Symbol
     """
 Ticks field - if ticks is not set or value is 0, getChartRangeRequest  works as before (you must send valid start and end time fields).
@@ -63,4 +69,19 @@ class TransactionRequest(XTBDataClass):
 
 @dataclass
 class TransactionStatusRequest(XTBDataClass):
-    order: int
\ No newline at end of file
+    order: int
+
+
+@dataclass
+class MarginTradeRequest(XTBDataClass):
+    symbol: str
+    volume: float
+
+
+@dataclass
+class ProfitCalculationRequest(XTBDataClass):
+    close_price: float  # theoretical close price of order
+    cmd: TradeOperation  # Operation code
+    open_price: float  # theoretical open price of order
+    symbol: str
+    volume: float
@@ -0,0 +1,130 @@
+import dataclasses
+import datetime
+import zoneinfo
+from typing import Iterable, Optional
+
+from XTBClient.models.models import Period, RateInfo
+
+# XTB candles are aligned on CET / CEST wall clock time (daily candles start at midnight CET / CEST)
+XTB_TIMEZONE = zoneinfo.ZoneInfo("Europe/Warsaw")
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _to_local(ctm: datetime.datetime) -> datetime.datetime:
+    # ctm values decoded from the API are naive UTC datetimes
+    if ctm.tzinfo is None:
+        ctm = ctm.replace(tzinfo=datetime.timezone.utc)
+    return ctm.astimezone(XTB_TIMEZONE)
+
+
+def _from_local(local: datetime.datetime, like: datetime.datetime) -> datetime.datetime:
+    # return the same kind of datetime (naive UTC or aware) as the one we got
+    result = local.astimezone(datetime.timezone.utc)
+    return result.replace(tzinfo=None) if like.tzinfo is None else result.astimezone(like.tzinfo)
+
+
+def candle_start(ctm: datetime.datetime, period: Period) -> datetime.datetime:
+    """Returns the start time of the `period` candle containing `ctm`, using XTB's CET / CEST candle boundaries"""
+    minutes = period.value
+    if minutes <= Period.PERIOD_H1.value:
+        # CET / CEST offsets are whole hours, so intraday boundaries up to one hour are the same in UTC, no need to convert
+        seconds = minutes * 60
+        epoch = int((ctm - _EPOCH).total_seconds()) if ctm.tzinfo is None else int(ctm.timestamp())
+        start = epoch - epoch % seconds
+        if ctm.tzinfo is None:
+            return _EPOCH + datetime.timedelta(seconds=start)
+        return datetime.datetime.fromtimestamp(start, tz=ctm.tzinfo)
+
+    local = _to_local(ctm)
+    if period == Period.PERIOD_MN1:
+        # monthly candles follow calendar months, not 30 days
+        local = local.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    elif period == Period.PERIOD_W1:
+        local = local.replace(hour=0, minute=0, second=0, microsecond=0) - datetime.timedelta(days=local.weekday())
+    elif period == Period.PERIOD_D1:
+        local = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    else:
+        minute_of_day = local.hour * 60 + local.minute
+        minute_of_day -= minute_of_day % minutes
+        local = local.replace(hour=minute_of_day // 60, minute=minute_of_day % 60, second=0, microsecond=0)
+
+    # rebuild the wall clock time so the offset matches the candle start, not the original ctm
+    local = datetime.datetime(local.year, local.month, local.day, local.hour, local.minute, tzinfo=XTB_TIMEZONE)
+    return _from_local(local, ctm)
+
+
+def _next_candle_start(start: datetime.datetime, period: Period) -> datetime.datetime:
+    if period.value <= Period.PERIOD_H1.value:
+        return start + datetime.timedelta(minutes=period.value)
+    # days are 23 or 25 hours long when DST changes and months aren't 30 days, overshoot a bit and round down
+    step = datetime.timedelta(days=32) if period == Period.PERIOD_MN1 else datetime.timedelta(minutes=period.value + 60)
+    return candle_start(start + step, period)
+
+
+def _ctm_string(ctm: datetime.datetime) -> str:
+    # same format as the server, no zero padding for the day and hour: "May 9, 2022, 8:00:00 PM"
+    local = _to_local(ctm)
+    hour = local.hour % 12 or 12
+    return f"{local:%b} {local.day}, {local.year}, {hour}:{local:%M:%S %p}"
+
+
+class CandleResampler:
+    """
+    Builds higher period candles from lower period ones (e.g. M1 -> M5, H1, D1).
+    Base candles must already be processed (absolute prices, as returned by the clients) and must be fed in chronological order.
+    """
+
+    def __init__(self, period: Period):
+        self.period = period
+        self.current: Optional[RateInfo] = None  # candle still being built, not complete until a candle from the next period arrives
+
+    def update(self, rates: Iterable[RateInfo]) -> list[RateInfo]:
+        """Adds new base candles and returns the candles they completed, a batch that raises leaves the resampler untouched"""
+        completed = []
+        # work on a copy, self.current is only replaced once the whole batch went through
+        current = dataclasses.replace(self.current) if self.current else None
+        period = self.period
+        start = current.ctm if current else None
+        # candles for the same bucket arrive in batches, only compute the bucket boundary once per bucket
+        end = _next_candle_start(start, period) if current else None
+
+        for rate in rates:
+            if current is not None and rate.ctm < end:
+                if rate.ctm < start:
+                    raise ValueError(f"Candle from {rate.ctm} is older than the current {period.name} candle from {start}")
+                if rate.high > current.high:
+                    current.high = rate.high
+                if rate.low < current.low:
+                    current.low = rate.low
+                current.close = rate.close
+                current.vol += rate.vol
+                continue
+
+            start = candle_start(rate.ctm, period)
+            if current is not None:
+                if start < current.ctm:
+                    raise ValueError(f"Candle from {rate.ctm} is older than the current {period.name} candle from {current.ctm}")
+                completed.append(current)
+
+            end = _next_candle_start(start, period)
+            current = RateInfo(close=rate.close, ctm=start, ctm_string=_ctm_string(start), high=rate.high, low=rate.low, open=rate.open, vol=rate.vol)
+
+        self.current = current
+        return completed
+
+    def flush(self) -> list[RateInfo]:
+        """Returns the candle still being built (if any), and starts from scratch"""
+        current, self.current = self.current, None
+        return [current] if current else []
+
+
+def resample(rates: Iterable[RateInfo], period: Period) -> list[RateInfo]:
+    """Resamples the given base candles to `period`, the last (possibly incomplete) candle is included"""
+    resampler = CandleResampler(period)
+    return resampler.update(rates) + resampler.flush()
+
+
+def resample_all(rates: list[RateInfo], periods: Iterable[Period]) -> dict[Period, list[RateInfo]]:
+    """Builds candles for several periods from the same base candles (e.g. fetch M1 once and build everything else from it)"""
+    return {period: resample(rates, period) for period in periods}
@@ -0,0 +1,82 @@
+import dataclasses
+import decimal
+from typing import Iterable
+
+from XTBClient.errors import InvalidTransaction, UnknownSymbolError
+from XTBClient.models.models import Symbol, Transaction, TradeOperation, TradeType
+
+_BUY_OPERATIONS = {TradeOperation.Buy, TradeOperation.Buy_Limit, TradeOperation.Buy_Stop}
+_SELL_OPERATIONS = {TradeOperation.Sell, TradeOperation.Sell_Limit, TradeOperation.Sell_stop}
+_PENDING_OPERATIONS = {TradeOperation.Buy_Limit, TradeOperation.Buy_Stop, TradeOperation.Sell_Limit, TradeOperation.Sell_stop}
+
+
+def _decimals(value: float) -> int:
+    return max(0, -decimal.Decimal(str(value)).normalize().as_tuple().exponent)
+
+
+class TransactionValidator:
+    """
+    Checks and normalizes transactions locally against cached Symbol metadata before they're sent with trade_transaction:
+    volumes are rounded to the lot step, prices to the symbol precision and impossible orders raise InvalidTransaction.
+    """
+
+    def __init__(self, symbols: Iterable[Symbol] = ()):
+        self.symbols: dict[str, Symbol] = {}
+        self._lot_decimals: dict[str, int] = {}  # decimal places of the lot step, used to get rid of floating point noise
+        self.update_symbols(symbols)
+
+    def update_symbols(self, symbols: Iterable[Symbol]) -> None:
+        for symbol in symbols:
+            self.symbols[symbol.symbol] = symbol
+            self._lot_decimals[symbol.symbol] = _decimals(symbol.lot_step)
+
+    def validate(self, transaction: Transaction) -> Transaction:
+        """Returns the normalized transaction, the original one is left untouched"""
+        symbol = self.symbols.get(transaction.symbol)
+        if symbol is None:
+            raise UnknownSymbolError(f"Symbol {transaction.symbol} is not cached")
+
+        cmd = transaction.cmd
+        if cmd not in _BUY_OPERATIONS and cmd not in _SELL_OPERATIONS:
+            raise InvalidTransaction(symbol.symbol, "cmd", f"{cmd.name} is not a trade operation")
+        if transaction.type == TradeType.Open and cmd in _SELL_OPERATIONS and symbol.long_only:
+            raise InvalidTransaction(symbol.symbol, "cmd", "Symbol is long only, it can't be sold short")
+
+        volume = transaction.volume
+        if transaction.type in (TradeType.Open, TradeType.Close, TradeType.Pending):
+            volume = round(round(volume / symbol.lot_step) * symbol.lot_step, self._lot_decimals[symbol.symbol])
+            if volume < symbol.lot_min or volume > symbol.lot_max:
+                raise InvalidTransaction(symbol.symbol, "volume", f"Volume {transaction.volume} is outside [{symbol.lot_min}, {symbol.lot_max}]")
+
+        precision = symbol.precision
+        price = round(transaction.price, precision)
+        sl = round(transaction.sl, precision)
+        tp = round(transaction.tp, precision)
+        if transaction.type in (TradeType.Open, TradeType.Modify):
+            self._check_stops(symbol, cmd, price, sl, tp)
+
+        return dataclasses.replace(transaction, volume=volume, price=price, sl=sl, tp=tp)
+
+    @staticmethod
+    def _check_stops(symbol: Symbol, cmd: TradeOperation, price: float, sl: float, tp: float) -> None:
+        if not sl and not tp:
+            return
+
+        # pending orders are checked against their own price, market orders against the price they'll be closed at
+        if cmd in _PENDING_OPERATIONS:
+            reference = price
+        else:
+            reference = symbol.bid if cmd in _BUY_OPERATIONS else symbol.ask
+        # stops level is in pips, allow half a price step for rounding
+        distance = symbol.stops_level * 10 ** -symbol.pips_precision - 10 ** -symbol.precision / 2
+
+        if cmd in _BUY_OPERATIONS:
+            if sl and reference - sl < distance:
+                raise InvalidTransaction(symbol.symbol, "sl", f"Stop loss {sl} must be at least {symbol.stops_level} pips below {reference}")
+            if tp and tp - reference < distance:
+                raise InvalidTransaction(symbol.symbol, "tp", f"Take profit {tp} must be at least {symbol.stops_level} pips above {reference}")
+        else:
+            if sl and sl - reference < distance:
+                raise InvalidTransaction(symbol.symbol, "sl", f"Stop loss {sl} must be at least {symbol.stops_level} pips above {reference}")
+            if tp and reference - tp < distance:
+                raise InvalidTransaction(symbol.symbol, "tp", f"Take profit {tp} must be at least {symbol.stops_level} pips below {reference}")
@@ -0,0 +1,105 @@
+import abc
+import asyncio
+import datetime
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Optional, Union
+
+from XTBClient.client.axtb import XTBAsyncClient
+from XTBClient.models.models import Calendar, News
+from XTBClient.xtb_base import cached_schema
+
+
+class ChangeType(Enum):
+    New = 0
+    Updated = 1
+
+
+@dataclass
+class ChangeEvent:
+    change: ChangeType
+    entry: Union[Calendar, News]
+
+
+class _ChangeWatcher(abc.ABC):
+    # polls a command and only decodes the entries that are new or changed since the previous poll
+    result_type = None
+
+    def __init__(self, client: XTBAsyncClient, interval: float):
+        self.client = client
+        self.interval = interval  # seconds between polls
+        self._last: Optional[list[dict]] = None  # previous raw response
+        self._entries: dict[tuple, dict] = {}  # previous raw entries, by key
+
+    @abc.abstractmethod
+    async def _fetch(self) -> list[dict]:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def _key(raw: dict) -> tuple:
+        pass
+
+    async def poll(self) -> list[ChangeEvent]:
+        """Fetches the data once and returns the new and updated entries, all entries are new the first time"""
+        data = await self._fetch()
+        if data == self._last:
+            return []  # nothing changed, don't bother decoding anything
+
+        changed = []
+        changes = []
+        entries = {}
+        seen = {}
+        for raw in data:
+            key = self._key(raw)
+            # the same key can show up more than once in a response, tell them apart by the order they came in
+            count = seen.get(key, 0)
+            seen[key] = count + 1
+            key += (count,)
+            previous = self._entries.get(key)
+            if previous != raw:
+                changed.append(raw)
+                changes.append(ChangeType.New if previous is None else ChangeType.Updated)
+            entries[key] = raw
+
+        self._last = data
+        self._entries = entries
+        if not changed:
+            return []  # same entries in a different order
+        return [ChangeEvent(change, entry) for change, entry in zip(changes, cached_schema(self.result_type).load(changed, many=True))]
+
+    async def watch(self) -> AsyncIterator[ChangeEvent]:
+        """Polls forever, yielding every new or updated entry"""
+        while True:
+            for event in await self.poll():
+                yield event
+            await asyncio.sleep(self.interval)
+
+
+class CalendarWatcher(_ChangeWatcher):
+    """Watches get_calendar, an entry is updated when e.g. its current value gets filled in after the release"""
+    result_type = Calendar
+
+    async def _fetch(self) -> list[dict]:
+        return await self.client.get_calendar_raw()
+
+    @staticmethod
+    def _key(raw: dict) -> tuple:
+        # calendar entries don't have an id
+        return raw.get("time"), raw.get("country"), raw.get("title"), raw.get("period")
+
+
+class NewsWatcher(_ChangeWatcher):
+    """Watches get_news, for the news published since `start`"""
+    result_type = News
+
+    def __init__(self, client: XTBAsyncClient, interval: float, start: datetime.datetime):
+        super().__init__(client, interval)
+        self.start = start
+
+    async def _fetch(self) -> list[dict]:
+        return await self.client.get_news_raw(self.start)
+
+    @staticmethod
+    def _key(raw: dict) -> tuple:
+        return raw.get("key"),
@@ -1,5 +1,6 @@
 import abc
 import datetime
+import functools
 import logging
 import typing
 from typing import Type, Union
@@ -7,10 +8,16 @@ from typing import Type, Union
 from dataclasses_json import dataclass_json
 
 from XTBClient.models.models import ConnectionMode, Symbol, Calendar, CurrentUserData, Trade, RateInfo, Transaction, TransactionStatus, \
-    XTBDataClass
+    XTBDataClass, TradeOperation, News
 from XTBClient.models.requests import ChartLastInfoRecord, ChartRangeRecord, LoginRequest
 
 
+@functools.lru_cache(maxsize=None)
+def cached_schema(data_class: Type[dataclass_json]):
+    # building a marshmallow schema is expensive, only do it once per data class
+    return data_class.schema()
+
+
 class XTBBaseClient(abc.ABC):
     def __init__(self, user: str, password: str, mode: ConnectionMode, automatic_logout = True, url: str = "wss://ws.xtb.com/", custom_tag: str = "python-xtb-api"):
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -38,11 +45,14 @@ class XTBBaseClient(abc.ABC):
         if result_type:
             data = response[data_key]
 
+            if result_type is dict or result_type == list[dict]:
+                return data  # raw data, decoded by the caller
+
             # check if we have a list of something as result
             if typing.get_origin(result_type) == list:
                 # if we have a list of elements, convert them with marshmallow schema
                 args = typing.get_args(result_type)
-                return args[0].schema().load(data, many=True)
+                return cached_schema(args[0]).load(data, many=True)
             elif issubclass(result_type, XTBDataClass):
                 # if it's one of our data types convert it with dataclasses-json
                 return result_type.from_dict(data)
@@ -70,6 +80,18 @@ class XTBBaseClient(abc.ABC):
     def get_calendar(self) -> list[Calendar]:
         pass
 
+    @abc.abstractmethod
+    def get_calendar_raw(self) -> list[dict]:
+        pass
+
+    @abc.abstractmethod
+    def get_news_raw(self, start: datetime.datetime, end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[dict]:
+        pass
+
+    @abc.abstractmethod
+    def get_news(self, start: datetime.datetime, end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[News]:
+        pass
+
     @abc.abstractmethod
     def get_current_user_data(self) -> CurrentUserData:
         pass
@@ -94,6 +116,14 @@ class XTBBaseClient(abc.ABC):
     def get_chart_range_request(self, chart_range: ChartRangeRecord) -> list[RateInfo]:
         pass
 
+    @abc.abstractmethod
+    def get_chart_range_request_raw(self, chart_range: ChartRangeRecord) -> dict:
+        pass
+
+    @abc.abstractmethod
+    def get_trades_history_raw(self, start: datetime.datetime = datetime.datetime.fromtimestamp(0), end: datetime.datetime = datetime.datetime.fromtimestamp(0)) -> list[dict]:
+        pass
+
     @abc.abstractmethod
     def trade_transaction(self, transaction: Transaction) -> int:
         pass
@@ -101,3 +131,11 @@ class XTBBaseClient(abc.ABC):
     @abc.abstractmethod
     def transaction_status(self, transaction_id: int) -> TransactionStatus:
         pass
+
+    @abc.abstractmethod
+    def calc_margin(self, symbol: str, volume: float) -> float:
+        pass
+
+    @abc.abstractmethod
+    def calc_profit(self, symbol: str, cmd: TradeOperation, volume: float, open_price: float, close_price: float) -> float:
+        pass
@@ -0,0 +1,28 @@
+import pytest
+
+from XTBClient.models.models import XTBCommand, TradeOperation
+from XTBClient.models.requests import MarginTradeRequest, ProfitCalculationRequest
+from tests import testing_utils
+
+
+@pytest.mark.asyncio
+async def test_calc_margin(mocker):
+    client = testing_utils.mock_xtb_client(mocker, connected=True)
+    testing_utils.mock_next_client_response(client, mocker, "tests/data/get_margin_trade.json")
+    margin = await client.calc_margin("EURPLN", 1.0)
+    testing_utils.assert_command_sent(client, XTBCommand.GET_MARGIN_TRADE, MarginTradeRequest("EURPLN", 1.0))
+    assert client.xtb_session.send.call_args.args[0] == \
+        '{"command": "getMarginTrade", "customTag": "python-xtb-api", "arguments": {"symbol": "EURPLN", "volume": 1.0}, "prettyPrint": true}'
+    assert margin == 4399.35
+
+
+@pytest.mark.asyncio
+async def test_calc_profit(mocker):
+    client = testing_utils.mock_xtb_client(mocker, connected=True)
+    testing_utils.mock_next_client_response(client, mocker, "tests/data/get_profit_calculation.json")
+    profit = await client.calc_profit("EURPLN", TradeOperation.Buy, 1.0, 1.2233, 1.3)
+    testing_utils.assert_command_sent(client, XTBCommand.GET_PROFIT_CALCULATION, ProfitCalculationRequest(1.3, TradeOperation.Buy, 1.2233, "EURPLN", 1.0))
+    assert client.xtb_session.send.call_args.args[0] == \
+        '{"command": "getProfitCalculation", "customTag": "python-xtb-api", ' \
+        '"arguments": {"closePrice": 1.3, "cmd": 0, "openPrice": 1.2233, "symbol": "EURPLN", "volume": 1.0}, "prettyPrint": true}'
+    assert profit == 714.303
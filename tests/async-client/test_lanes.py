@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from XTBClient.client.lanes import XTBLanesAsyncClient, TRADING_LANE, BULK_LANE
+from XTBClient.models.models import ConnectionMode, XTBCommand
+from tests import testing_utils
+
+
+def test_routing():
+    client = XTBLanesAsyncClient("test_user", "test_password", ConnectionMode.DEMO, url="", routes={XTBCommand.GET_CALENDAR: "news"})
+    assert set(client.lanes) == {TRADING_LANE, BULK_LANE, "news"}
+    assert client.lane_for(XTBCommand.TRADE_TRANSACTION) == TRADING_LANE
+    assert client.lane_for(XTBCommand.GET_CALENDAR) == "news"
+    assert client.lane_for(XTBCommand.GET_ALL_SYMBOLS) == BULK_LANE
+
+
+@pytest.mark.asyncio
+async def test_trading_lane_is_isolated(mocker):
+    client = testing_utils.mock_xtb_client(mocker, connected=True, client_class=XTBLanesAsyncClient, routes={XTBCommand.GET_CALENDAR: "news"})
+    testing_utils.mock_next_client_response(client.lanes[BULK_LANE], mocker, "tests/data/get_all_symbols-small.json", delay=0.3)
+    testing_utils.mock_next_client_response(client.lanes[TRADING_LANE], mocker, "tests/data/get_trades.json")
+
+    symbols, trades = await asyncio.gather(client.get_all_symbols(), client.get_trades(False))
+    assert symbols and trades
+
+    client.lanes[BULK_LANE].xtb_session.send.assert_called_once()
+    client.lanes[TRADING_LANE].xtb_session.send.assert_called_once()
+    client.lanes["news"].xtb_session.send.assert_not_called()
+    assert client.stats[TRADING_LANE].per_command == {XTBCommand.GET_TRADES: 1}
+    assert client.stats[TRADING_LANE].max < 0.1 < client.stats[BULK_LANE].max
+
+
+@pytest.mark.asyncio
+async def test_failed_lane_closes_the_others(mocker):
+    client = testing_utils.mock_xtb_client(mocker, login_successful=False, client_class=XTBLanesAsyncClient)
+    # the first lane connects and logs in, the second one can't connect
+    session = mocker.AsyncMock()
+    session.recv.return_value = '{"status": true, "customTag": "' + client.custom_tag + '", "streamSessionId": "12345"}'
+    mocker.patch("websockets.connect", new=mocker.AsyncMock(side_effect=[session, OSError("Connection refused")]))
+
+    with pytest.raises(OSError):
+        await client.__aenter__()
+
+    session.close.assert_awaited_once()
+    assert all(getattr(lane, "xtb_session", None) is None for lane in client.lanes.values())
+    assert not client.logged_in
@@ -0,0 +1,57 @@
+import datetime
+import json
+
+import pytest
+
+from XTBClient.models.models import Calendar, News, XTBCommand
+from XTBClient.models.requests import NewsRequest
+from XTBClient import watcher as watcher_module
+from XTBClient.watcher import CalendarWatcher, NewsWatcher, ChangeType
+from tests import testing_utils
+
+
+@pytest.mark.asyncio
+async def test_get_news(mocker):
+    client = testing_utils.mock_xtb_client(mocker, connected=True)
+    testing_utils.mock_next_client_response(client, mocker, "tests/data/get_news.json")
+    start = datetime.datetime(2022, 5, 10)
+    news = await client.get_news(start)
+    testing_utils.assert_command_sent(client, XTBCommand.GET_NEWS, NewsRequest(start=start, end=datetime.datetime.fromtimestamp(0)))
+    assert len(news) == 2
+    assert isinstance(news[0], News)
+
+
+@pytest.mark.asyncio
+async def test_calendar_watcher(mocker):
+    client = testing_utils.mock_xtb_client(mocker, connected=True)
+    calendar = json.loads(testing_utils.get_test_file_data("tests/data/get_calendar.json"))
+    watcher = CalendarWatcher(client, interval=1)
+
+    testing_utils.mock_next_client_response(client, mocker, data=calendar)
+    events = await watcher.poll()
+    assert len(events) == len(calendar)
+    assert all(event.change == ChangeType.New and isinstance(event.entry, Calendar) for event in events)
+
+    schema = mocker.spy(watcher_module, "cached_schema")
+    assert await watcher.poll() == []
+    schema.assert_not_called()
+
+    calendar = json.loads(testing_utils.get_test_file_data("tests/data/get_calendar.json"))
+    calendar[1]["current"] = "5.1"
+    testing_utils.mock_next_client_response(client, mocker, data=calendar)
+    events = await watcher.poll()
+    assert [(event.change, event.entry.title, event.entry.current) for event in events] == [(ChangeType.Updated, calendar[1]["title"], "5.1")]
+
+
+@pytest.mark.asyncio
+async def test_news_watcher(mocker):
+    client = testing_utils.mock_xtb_client(mocker, connected=True)
+    news = json.loads(testing_utils.get_test_file_data("tests/data/get_news.json"))
+    watcher = NewsWatcher(client, interval=1, start=datetime.datetime(2022, 5, 10))
+
+    testing_utils.mock_next_client_response(client, mocker, data=news[1:])
+    assert len(await watcher.poll()) == 1
+
+    testing_utils.mock_next_client_response(client, mocker, data=news)
+    events = await watcher.poll()
+    assert [(event.change, event.entry.key) for event in events] == [(ChangeType.New, news[0]["key"])]
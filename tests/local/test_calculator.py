@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from XTBClient.calculator import TradeCalculator
+from XTBClient.errors import UnknownSymbolError, UnsupportedCalculation
+from XTBClient.models.models import TradeOperation
+from tests import testing_utils
+
+
+def load_cases(file_name):
+    # every case holds getMarginTrade / getProfitCalculation arguments and the expected value, worked out by hand from calc_symbols.json
+    # these are not recorded XTB replies, they only guard the formulas against regressions
+    return [(case["arguments"], case["expected"]) for case in json.loads(testing_utils.get_test_file_data(file_name))]
+
+
+@pytest.fixture
+def calculator():
+    symbols = testing_utils.load_symbols()
+    return TradeCalculator("PLN", symbols)
+
+
+# formula regression tests: the expected values come from the same formulas as TradeCalculator, they don't prove the formulas match XTB
+# until they are replaced by recorded getMarginTrade / getProfitCalculation replies
+def test_margin_formula_regression(calculator):
+    cases = load_cases("tests/data/calc_margin_derived.json")
+    margins = calculator.calc_margins([args["symbol"] for args, _ in cases], [args["volume"] for args, _ in cases])
+    assert margins == pytest.approx([expected for _, expected in cases], abs=0.01)
+
+
+def test_profit_formula_regression(calculator):
+    cases = load_cases("tests/data/calc_profit_derived.json")
+    profits = calculator.calc_profits([args["symbol"] for args, _ in cases], [TradeOperation(args["cmd"]) for args, _ in cases],
+                                      [args["volume"] for args, _ in cases], [args["openPrice"] for args, _ in cases],
+                                      [args["closePrice"] for args, _ in cases])
+    assert profits == pytest.approx([expected for _, expected in cases], abs=0.01)
+
+
+def test_missing_conversion(calculator):
+    calculator.currency = "GBP"
+    calculator.update_quotes([])
+    with pytest.raises(UnknownSymbolError):
+        calculator.calc_margin("DE30", 1.0)
+    with pytest.raises(UnknownSymbolError):
+        calculator.calc_margin("UNKNOWN", 1.0)
+
+
+def test_unsupported_margin_mode(calculator):
+    # TGNA.US_9 uses margin mode 104
+    with pytest.raises(UnsupportedCalculation):
+        calculator.calc_margin("TGNA.US_9", 1.0)
+    assert calculator.calc_profit("TGNA.US_9", TradeOperation.Buy, 1.0, 21.0, 22.0) == pytest.approx(4.4573)
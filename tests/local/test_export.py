@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from XTBClient import export
+from tests import testing_utils
+
+# raw rateInfos as sent by the server, prices are shifted and multiplied by 10 ** digits
+RATE_INFOS = [
+    {"ctm": 1652090400000, "ctmString": "May 9, 2022, 12:00:00 PM", "open": 105502, "high": 12, "low": -5, "close": 3, "vol": 120.0},
+    {"ctm": 1652090460000, "ctmString": "May 9, 2022, 12:01:00 PM", "open": 105505, "high": 4, "low": -2, "close": -1, "vol": 80.0},
+    {"ctm": 1652090520000, "ctmString": "May 9, 2022, 12:02:00 PM", "open": 105504, "high": 0, "low": -10, "close": -10, "vol": 95.0},
+]
+
+
+def trades():
+    return json.loads(testing_utils.get_test_file_data("tests/data/get_trades.json"))
+
+
+def test_rates_to_csv():
+    out = io.StringIO()
+    assert export.rates_to_csv(RATE_INFOS, 5, out, chunk_size=2) == 3
+    lines = out.getvalue().splitlines()
+    assert lines[0] == ",".join(export.RATE_COLUMNS)
+    assert lines[1] == "1652090400000,1.05502,1.05514,1.05497,1.05505,120.0"
+    assert len(lines) == 4
+
+
+def test_trades_to_csv():
+    out = io.StringIO()
+    assert export.trades_to_csv(trades(), out) == len(trades())
+    assert out.getvalue().splitlines()[1].startswith("384264773,384264773,384264837,SOLANA,0,2.0,67.03,66.49")
+
+
+def test_rates_to_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    path = tmp_path / "rates.parquet"
+    assert export.rates_to_parquet(iter(RATE_INFOS), 5, str(path), chunk_size=2) == 3
+    parquet = pyarrow.parquet.ParquetFile(str(path))
+    assert parquet.num_row_groups == 2
+    table = parquet.read()
+    assert table.column("close").to_pylist() == pytest.approx([1.05505, 1.05504, 1.05494])
+    assert table.schema.field("ctm").type == pa.timestamp("ms", tz="UTC")
+    assert table.column("ctm")[0].value == 1652090400000
+
+
+def test_trades_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    sink = pa.BufferOutputStream()
+    export.trades_to_arrow(trades(), sink, chunk_size=1)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.num_rows == len(trades())
+    assert table.column("symbol")[0].as_py() == "SOLANA"
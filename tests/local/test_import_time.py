@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+# regression budget for importing both clients, including everything they pull in (dataclasses_json, marshmallow, ...), in microseconds
+# currently around 100ms, the budget leaves room for slower CI machines
+IMPORT_BUDGET_US = 250_000
+RUNS = 5  # the fastest run is used, to keep CI noise out
+# heavy optional libraries, only imported when a feature needs them (e.g. pyarrow for XTBClient.export)
+HEAVY_MODULES = {"pyarrow", "numpy", "pandas"}
+
+
+def import_times(statement: str) -> dict[str, int]:
+    # -X importtime reports "self time | cumulative time | module" for every imported module
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_clients_only_load_their_websocket_library():
+    times = import_times("from XTBClient.client import XTBAsyncClient")
+    assert "websocket" not in times
+    assert "websockets" not in times
+
+    times = import_times("from XTBClient.client import XTBSyncClient")
+    assert "websocket" not in times
+    assert "websockets" not in times
+
+
+def test_clients_dont_load_heavy_libraries():
+    times = import_times("import XTBClient.client.axtb, XTBClient.client.xtb, XTBClient.client.lanes, XTBClient.calculator, XTBClient.export, "
+                         "XTBClient.resample, XTBClient.validation, XTBClient.watcher")
+    assert not HEAVY_MODULES & set(times)
+
+
+def test_import_budget():
+    fastest = None
+    for _ in range(RUNS):
+        times = import_times("import XTBClient.client.axtb, XTBClient.client.xtb")
+        total = times["XTBClient.client.axtb"] + times["XTBClient.client.xtb"]
+        fastest = total if fastest is None else min(fastest, total)
+    assert fastest < IMPORT_BUDGET_US, f"Importing the clients took {fastest}us, budget is {IMPORT_BUDGET_US}us"
@@ -0,0 +1,71 @@
+import datetime
+
+import pytest
+
+from XTBClient.models.models import Period, RateInfo
+from XTBClient.resample import CandleResampler, candle_start, resample
+
+
+def make_rates(start: datetime.datetime, count: int, minutes: int = 1) -> list[RateInfo]:
+    rates = []
+    for i in range(count):
+        ctm = start + datetime.timedelta(minutes=i * minutes)
+        rates.append(RateInfo(close=i + 0.5, ctm=ctm, ctm_string="", high=i + 1.0, low=i - 1.0, open=float(i), vol=1.0))
+    return rates
+
+
+def test_resample_m5():
+    candles = resample(make_rates(datetime.datetime(2022, 5, 9, 10, 2), 10), Period.PERIOD_M5)
+    assert [c.ctm for c in candles] == [datetime.datetime(2022, 5, 9, 10, 0), datetime.datetime(2022, 5, 9, 10, 5), datetime.datetime(2022, 5, 9, 10, 10)]
+    first = candles[0]
+    assert (first.open, first.high, first.low, first.close, first.vol) == (0.0, 3.0, -1.0, 2.5, 3.0)
+    assert sum(c.vol for c in candles) == 10
+    # 10:00 UTC is 12:00 CEST, same format as the ctmString sent by the server
+    assert first.ctm_string == "May 9, 2022, 12:00:00 PM"
+
+
+def test_daily_candles_start_at_cet_midnight():
+    # 22:00 UTC is midnight CEST in summer, 23:00 UTC is midnight CET in winter
+    assert candle_start(datetime.datetime(2022, 5, 9, 21, 59), Period.PERIOD_D1) == datetime.datetime(2022, 5, 8, 22, 0)
+    assert candle_start(datetime.datetime(2022, 5, 9, 22, 0), Period.PERIOD_D1) == datetime.datetime(2022, 5, 9, 22, 0)
+    assert candle_start(datetime.datetime(2022, 1, 10, 22, 30), Period.PERIOD_D1) == datetime.datetime(2022, 1, 9, 23, 0)
+    assert candle_start(datetime.datetime(2022, 1, 10, 23, 30), Period.PERIOD_H4) == datetime.datetime(2022, 1, 10, 23, 0)
+    assert candle_start(datetime.datetime(2022, 5, 18, 12, 0), Period.PERIOD_MN1) == datetime.datetime(2022, 4, 30, 22, 0)
+
+
+def test_daily_candles_across_dst_change():
+    # 30th of October 2022 is 25 hours long in CET / CEST
+    candles = resample(make_rates(datetime.datetime(2022, 10, 29, 22, 0), 3 * 24, minutes=60), Period.PERIOD_D1)
+    assert [c.ctm for c in candles] == [datetime.datetime(2022, 10, 29, 22, 0), datetime.datetime(2022, 10, 30, 23, 0), datetime.datetime(2022, 10, 31, 23, 0)]
+    assert [c.vol for c in candles] == [25, 24, 23]
+    assert candles[1].ctm_string == "Oct 31, 2022, 12:00:00 AM"
+
+
+def test_incremental_update_matches_batch():
+    rates = make_rates(datetime.datetime(2022, 5, 9, 9, 0), 180)
+    resampler = CandleResampler(Period.PERIOD_H1)
+    completed = []
+    for i in range(0, len(rates), 7):
+        completed += resampler.update(rates[i:i + 7])
+    assert len(completed) == 2
+    assert resampler.current.ctm == datetime.datetime(2022, 5, 9, 11, 0)
+    assert [c.to_dict() for c in completed + resampler.flush()] == [c.to_dict() for c in resample(make_rates(datetime.datetime(2022, 5, 9, 9, 0), 180), Period.PERIOD_H1)]
+
+
+def test_out_of_order_candle():
+    resampler = CandleResampler(Period.PERIOD_M5)
+    resampler.update(make_rates(datetime.datetime(2022, 5, 9, 10, 10), 1))
+    with pytest.raises(ValueError):
+        resampler.update(make_rates(datetime.datetime(2022, 5, 9, 10, 0), 1))
+
+
+def test_rejected_batch_leaves_resampler_untouched():
+    rates = make_rates(datetime.datetime(2022, 5, 9, 10, 0), 7)
+    resampler = CandleResampler(Period.PERIOD_M5)
+    resampler.update(rates[:1])
+    with pytest.raises(ValueError):
+        resampler.update([rates[1], rates[6], rates[0]])
+    assert resampler.current.vol == 1
+
+    candles = resampler.update([rates[1], rates[6]]) + resampler.flush()
+    assert [c.to_dict() for c in candles] == [c.to_dict() for c in resample([rates[0], rates[1], rates[6]], Period.PERIOD_M5)]
@@ -0,0 +1,53 @@
+import dataclasses
+import datetime
+
+import pytest
+
+from XTBClient.errors import InvalidTransaction, UnknownSymbolError
+from XTBClient.models.models import Transaction, TradeOperation, TradeType
+from XTBClient.validation import TransactionValidator
+from tests import testing_utils
+
+
+@pytest.fixture
+def validator():
+    symbols = testing_utils.load_symbols()
+    # EURUSD bid 1.05502, ask 1.05510, stop loss and take profit must be 10 pips away
+    symbols = [dataclasses.replace(symbol, stops_level=10) if symbol.symbol == "EURUSD" else symbol for symbol in symbols]
+    return TransactionValidator(symbols)
+
+
+def transaction(symbol="EURUSD", cmd=TradeOperation.Buy, volume=1.0, price=1.0551, sl=0.0, tp=0.0, type=TradeType.Open):
+    return Transaction(cmd=cmd, expiration=datetime.datetime(2030, 1, 1), offset=0, price=price, sl=sl, symbol=symbol, tp=tp, type=type, volume=volume)
+
+
+def test_normalization(validator):
+    original = transaction(volume=0.123, price=1.055123456, sl=1.0401234, tp=1.07)
+    normalized = validator.validate(original)
+    assert (normalized.volume, normalized.price, normalized.sl, normalized.tp) == (0.12, 1.05512, 1.04012, 1.07)
+    assert original.volume == 0.123
+
+
+@pytest.mark.parametrize("field, changes", [
+    ("volume", dict(volume=0.004)),
+    ("volume", dict(volume=150)),
+    ("sl", dict(sl=1.0545)),
+    ("tp", dict(tp=1.0555)),
+    ("sl", dict(cmd=TradeOperation.Sell, sl=1.0502)),
+    ("cmd", dict(symbol="TGNA.US_9", cmd=TradeOperation.Sell, price=21.74)),
+])
+def test_rejected(validator, field, changes):
+    with pytest.raises(InvalidTransaction) as error:
+        validator.validate(transaction(**changes))
+    assert error.value.field == field
+
+
+def test_stops_for_pending_orders_use_order_price(validator):
+    validator.validate(transaction(cmd=TradeOperation.Buy_Limit, price=1.0400, sl=1.0390, tp=1.0500))
+    with pytest.raises(InvalidTransaction):
+        validator.validate(transaction(cmd=TradeOperation.Buy_Limit, price=1.0400, sl=1.0395))
+
+
+def test_unknown_symbol(validator):
+    with pytest.raises(UnknownSymbolError):
+        validator.validate(transaction(symbol="UNKNOWN"))
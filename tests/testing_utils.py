@@ -1,15 +1,22 @@
+import asyncio
 import json
 from pathlib import Path
 
 from XTBClient.client.axtb import XTBAsyncClient
-from XTBClient.models.models import ConnectionMode, XTBCommand, XTBDataClass, ApiCommand
+from XTBClient.models.models import ConnectionMode, XTBCommand, XTBDataClass, ApiCommand, Symbol
 
 
-def mock_xtb_client(mocker, login_successful=True) -> XTBAsyncClient:
-    instance = XTBAsyncClient("test_user", "test_password", ConnectionMode.DEMO, url="", automatic_logout=False)  # make sure url isn't going anywhere
+def mock_xtb_client(mocker, login_successful=True, connected=False, client_class=XTBAsyncClient, **kwargs) -> XTBAsyncClient:
+    instance = client_class("test_user", "test_password", ConnectionMode.DEMO, url="", automatic_logout=False, **kwargs)  # make sure url isn't going anywhere
     instance.__websocket = mocker.patch("websockets.connect", new=mocker.AsyncMock())  # save our websocket mocked instance, just in case
     instance.logged_in = login_successful
 
+    if connected:
+        # give the client (or every lane of it) a mocked session without going through the context manager
+        for client in list(getattr(instance, "lanes", {}).values()) or [instance]:
+            client.xtb_session = mocker.AsyncMock()
+            client.logged_in = login_successful
+
     return instance
 
 
@@ -18,11 +25,23 @@ def get_test_file_data(file_name) -> str:
         return fin.read()
 
 
-def mock_next_client_response(client, mocker, file_name):
-    data = get_test_file_data(file_name)
-    full = '{"status": true, "customTag": "' + client.custom_tag + '", "returnData": ' + data + ' }'
+def load_symbols(file_name="tests/data/calc_symbols.json") -> list[Symbol]:
+    return Symbol.schema().load(json.loads(get_test_file_data(file_name)), many=True)
+
+
+def mock_next_client_response(client, mocker, file_name=None, data=None, delay=0):
+    # the response comes either from a test file or from the given data, optionally after `delay` seconds
+    raw = get_test_file_data(file_name) if file_name else json.dumps(data)
+    full = '{"status": true, "customTag": "' + client.custom_tag + '", "returnData": ' + raw + ' }'
+
+    if delay:
+        async def recv():
+            await asyncio.sleep(delay)
+            return full
 
-    client.xtb_session.recv = mocker.AsyncMock(return_value=full)
+        client.xtb_session.recv = mocker.AsyncMock(side_effect=recv)
+    else:
+        client.xtb_session.recv = mocker.AsyncMock(return_value=full)
     return client
 
 